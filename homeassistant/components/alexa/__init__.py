@@ -31,6 +31,7 @@ from .const import (
     CONF_TITLE,
     CONF_UID,
     DOMAIN,
+    MAX_PASSWORD_LENGTH,
 )
 
 CONF_FLASH_BRIEFINGS = "flash_briefings"
@@ -71,7 +72,9 @@ CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: {
             CONF_FLASH_BRIEFINGS: {
-                vol.Required(CONF_PASSWORD): cv.string,
+                vol.Required(CONF_PASSWORD): vol.All(
+                    cv.string, vol.Length(max=MAX_PASSWORD_LENGTH)
+                ),
                 cv.string: vol.All(
                     cv.ensure_list,
                     [
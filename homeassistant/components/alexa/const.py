@@ -15,6 +15,9 @@ CONF_AUDIO = "audio"
 CONF_TEXT = "text"
 CONF_DISPLAY_URL = "display_url"
 
+# Longer flash briefing passwords (in characters) are not accepted
+MAX_PASSWORD_LENGTH = 1024
+
 CONF_FILTER = "filter"
 CONF_ENTITY_CONFIG = "entity_config"
 CONF_ENDPOINT = "endpoint"
@@ -1,8 +1,12 @@
 """Support for Alexa skill service end point."""
 
+from collections.abc import Callable
+from functools import partial
 import hmac
 from http import HTTPStatus
 import logging
+import time
+from typing import Any
 import uuid
 
 from aiohttp.web_response import StreamResponse
@@ -11,6 +15,7 @@ from homeassistant.components import http
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import template
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
@@ -28,12 +33,29 @@ from .const import (
     CONF_TITLE,
     CONF_UID,
     DATE_FORMAT,
+    MAX_PASSWORD_LENGTH,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 FLASH_BRIEFINGS_API_ENDPOINT = "/api/alexa/flash_briefings/{briefing_id}"
 
+# Rejected requests are logged at most once per interval (seconds)
+REJECTED_REQUEST_LOG_INTERVAL = 60
+
+_TEXT_FIELDS = (
+    (CONF_TITLE, ATTR_TITLE_TEXT),
+    (CONF_TEXT, ATTR_MAIN_TEXT),
+    (CONF_AUDIO, ATTR_STREAM_URL),
+    (CONF_DISPLAY_URL, ATTR_REDIRECTION_URL),
+)
+
+_UNAUTHORIZED = (b"", HTTPStatus.UNAUTHORIZED)
+_NOT_FOUND = (b"", HTTPStatus.NOT_FOUND)
+
+type _Renderers = list[tuple[str, Callable[[], Any]]]
+type _CompiledItem = tuple[dict[str, Any], _Renderers, bytes | None]
+
 
 @callback
 def async_setup(hass: HomeAssistant, flash_briefing_config: ConfigType) -> None:
@@ -41,6 +63,35 @@ def async_setup(hass: HomeAssistant, flash_briefing_config: ConfigType) -> None:
     hass.http.register_view(AlexaFlashBriefingView(hass, flash_briefing_config))
 
 
+def _compile_item(item: ConfigType) -> _CompiledItem:
+    """Split a flash briefing item into static attributes and renderers."""
+    if (uid := item.get(CONF_UID)) is None:
+        uid = str(uuid.uuid4())
+    static: dict[str, Any] = {ATTR_UID: uid}
+    renderers: _Renderers = []
+
+    for conf_key, attr_key in _TEXT_FIELDS:
+        if (value := item.get(conf_key)) is None:
+            continue
+        if not isinstance(value, template.Template):
+            static[attr_key] = value
+        elif value.is_static:
+            # Static templates render to their source, skip rendering them
+            static[attr_key] = value.template
+        else:
+            renderers.append(
+                (attr_key, partial(value.async_render, parse_result=False))
+            )
+
+    if renderers:
+        return static, renderers, None
+
+    # Items without templates to render are serialized once, only the update
+    # date is spliced in per request
+    json_prefix = b'%s,%s:"' % (json_bytes(static)[:-1], json_bytes(ATTR_UPDATE_DATE))
+    return static, renderers, json_prefix
+
+
 class AlexaFlashBriefingView(http.HomeAssistantView):
     """Handle Alexa Flash Briefing skill requests."""
 
@@ -52,74 +103,92 @@ class AlexaFlashBriefingView(http.HomeAssistantView):
         """Initialize Alexa view."""
         super().__init__()
         self.flash_briefings = flash_briefings
+        self._password_bytes = flash_briefings[CONF_PASSWORD].encode("utf-8")
+        self._compiled_briefings: dict[str, list[_CompiledItem]] = {
+            briefing_id: [_compile_item(item) for item in briefing_config]
+            for briefing_id, briefing_config in flash_briefings.items()
+            if isinstance(briefing_config, list)
+        }
+        self._rejected_log_after = 0.0
+        self._rejected_suppressed = 0
+
+    def _log_rejected_request(self, err: str, briefing_id: str) -> None:
+        """Log a rejected request without letting requests flood the log."""
+        now = time.monotonic()
+        if now < self._rejected_log_after:
+            self._rejected_suppressed += 1
+            return
+
+        self._rejected_log_after = now + REJECTED_REQUEST_LOG_INTERVAL
+        if suppressed := self._rejected_suppressed:
+            self._rejected_suppressed = 0
+            err += " (%s more rejected requests since the last report)"
+            _LOGGER.error(err, briefing_id, suppressed)
+        else:
+            _LOGGER.error(err, briefing_id)
+
+    def _authenticate(
+        self, request: http.HomeAssistantRequest, briefing_id: str
+    ) -> bool:
+        """Check the password provided with a flash briefing request."""
+        if (password := request.query.get(API_PASSWORD)) is None:
+            self._log_rejected_request(
+                "No password provided for Alexa flash briefing: %s", briefing_id
+            )
+            return False
+
+        # Checking the length in characters first bounds the work spent encoding
+        # and comparing passwords that can never match the configured one
+        if len(password) > MAX_PASSWORD_LENGTH or not hmac.compare_digest(
+            password.encode("utf-8"), self._password_bytes
+        ):
+            self._log_rejected_request(
+                "Wrong password for Alexa flash briefing: %s", briefing_id
+            )
+            return False
+
+        return True
+
+    def _generate_briefing(
+        self, compiled_briefing: list[_CompiledItem]
+    ) -> list[dict[str, Any] | json_fragment]:
+        """Render the items of a configured flash briefing."""
+        now = dt_util.utcnow().strftime(DATE_FORMAT)
+        json_suffix = b'%s"}' % now.encode("utf-8")
+        briefing: list[dict[str, Any] | json_fragment] = []
+
+        for static, renderers, json_prefix in compiled_briefing:
+            if json_prefix is not None:
+                briefing.append(json_fragment(json_prefix + json_suffix))
+                continue
+            briefing.append(
+                {
+                    **static,
+                    **{attr_key: render() for attr_key, render in renderers},
+                    ATTR_UPDATE_DATE: now,
+                }
+            )
+
+        return briefing
 
     @callback
     def get(
         self, request: http.HomeAssistantRequest, briefing_id: str
     ) -> StreamResponse | tuple[bytes, HTTPStatus]:
         """Handle Alexa Flash Briefing request."""
-        _LOGGER.debug("Received Alexa flash briefing request for: %s", briefing_id)
-
-        if request.query.get(API_PASSWORD) is None:
-            err = "No password provided for Alexa flash briefing: %s"
-            _LOGGER.error(err, briefing_id)
-            return b"", HTTPStatus.UNAUTHORIZED
-
-        if not hmac.compare_digest(
-            request.query[API_PASSWORD].encode("utf-8"),
-            self.flash_briefings[CONF_PASSWORD].encode("utf-8"),
-        ):
-            err = "Wrong password for Alexa flash briefing: %s"
-            _LOGGER.error(err, briefing_id)
-            return b"", HTTPStatus.UNAUTHORIZED
-
-        if not isinstance(self.flash_briefings.get(briefing_id), list):
-            err = "No configured Alexa flash briefing was found for: %s"
-            _LOGGER.error(err, briefing_id)
-            return b"", HTTPStatus.NOT_FOUND
-
-        briefing = []
-
-        for item in self.flash_briefings.get(briefing_id, []):
-            output = {}
-            if item.get(CONF_TITLE) is not None:
-                if isinstance(item.get(CONF_TITLE), template.Template):
-                    output[ATTR_TITLE_TEXT] = item[CONF_TITLE].async_render(
-                        parse_result=False
-                    )
-                else:
-                    output[ATTR_TITLE_TEXT] = item.get(CONF_TITLE)
-
-            if item.get(CONF_TEXT) is not None:
-                if isinstance(item.get(CONF_TEXT), template.Template):
-                    output[ATTR_MAIN_TEXT] = item[CONF_TEXT].async_render(
-                        parse_result=False
-                    )
-                else:
-                    output[ATTR_MAIN_TEXT] = item.get(CONF_TEXT)
-
-            if (uid := item.get(CONF_UID)) is None:
-                uid = str(uuid.uuid4())
-            output[ATTR_UID] = uid
-
-            if item.get(CONF_AUDIO) is not None:
-                if isinstance(item.get(CONF_AUDIO), template.Template):
-                    output[ATTR_STREAM_URL] = item[CONF_AUDIO].async_render(
-                        parse_result=False
-                    )
-                else:
-                    output[ATTR_STREAM_URL] = item.get(CONF_AUDIO)
-
-            if item.get(CONF_DISPLAY_URL) is not None:
-                if isinstance(item.get(CONF_DISPLAY_URL), template.Template):
-                    output[ATTR_REDIRECTION_URL] = item[CONF_DISPLAY_URL].async_render(
-                        parse_result=False
-                    )
-                else:
-                    output[ATTR_REDIRECTION_URL] = item.get(CONF_DISPLAY_URL)
-
-            output[ATTR_UPDATE_DATE] = dt_util.utcnow().strftime(DATE_FORMAT)
-
-            briefing.append(output)
-
-        return self.json(briefing)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received Alexa flash briefing request for: %s", briefing_id)
+
+        # Unknown briefings are rejected before the password check, so whether a
+        # briefing exists is visible without a password. This is an accepted
+        # tradeoff, briefing ids are not secret and are part of the URL.
+        if (compiled_briefing := self._compiled_briefings.get(briefing_id)) is None:
+            self._log_rejected_request(
+                "No configured Alexa flash briefing was found for: %s", briefing_id
+            )
+            return _NOT_FOUND
+
+        if not self._authenticate(request, briefing_id):
+            return _UNAUTHORIZED
+
+        return self.json(self._generate_briefing(compiled_briefing))
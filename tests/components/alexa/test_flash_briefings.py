@@ -5,10 +5,14 @@ import datetime
 from http import HTTPStatus
 
 from aiohttp.test_utils import TestClient
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import alexa
 from homeassistant.components.alexa import const
+from homeassistant.components.alexa.flash_briefings import (
+    REJECTED_REQUEST_LOG_INTERVAL,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.setup import async_setup_component
 
@@ -64,6 +68,10 @@ def alexa_client(
                             "display_url": "https://npr.org",
                             "uid": "uuid",
                         },
+                        "templated": {
+                            "title": "{{ 'Templated' ~ ' title' }}",
+                            "uid": "templated_uuid",
+                        },
                     }
                 },
             },
@@ -87,6 +95,25 @@ async def test_flash_briefing_invalid_id(alexa_client) -> None:
     assert text == ""
 
 
+async def test_flash_briefing_invalid_id_no_password(alexa_client) -> None:
+    """Test an invalid Flash Briefing ID is rejected before authentication."""
+    req = await _flash_briefing_req(alexa_client, 10000, password=None)
+    assert req.status == HTTPStatus.NOT_FOUND
+    text = await req.text()
+    assert text == ""
+
+
+async def test_flash_briefing_invalid_id_rate_limited(
+    alexa_client, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test repeated requests for unknown Flash Briefings are logged once."""
+    for briefing_id in ("unknown1", "unknown2", "unknown3"):
+        req = await _flash_briefing_req(alexa_client, briefing_id, password=None)
+        assert req.status == HTTPStatus.NOT_FOUND
+
+    assert caplog.text.count("No configured Alexa flash briefing was found") == 1
+
+
 async def test_flash_briefing_no_password(alexa_client) -> None:
     """Test for no Flash Briefing password."""
     req = await _flash_briefing_req(alexa_client, "weather", password=None)
@@ -103,6 +130,42 @@ async def test_flash_briefing_invalid_password(alexa_client) -> None:
     assert text == ""
 
 
+async def test_flash_briefing_auth_errors_rate_limited(
+    alexa_client, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test repeated authentication failures are logged once."""
+    for _ in range(3):
+        req = await _flash_briefing_req(alexa_client, "weather", password="wrongpass")
+        assert req.status == HTTPStatus.UNAUTHORIZED
+
+    assert caplog.text.count("Wrong password for Alexa flash briefing") == 1
+
+
+async def test_flash_briefing_rejected_requests_reported(
+    alexa_client, caplog: pytest.LogCaptureFixture, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test suppressed rejected requests are counted in the next report."""
+    for _ in range(3):
+        req = await _flash_briefing_req(alexa_client, "weather", password="wrongpass")
+        assert req.status == HTTPStatus.UNAUTHORIZED
+
+    freezer.tick(REJECTED_REQUEST_LOG_INTERVAL + 1)
+    req = await _flash_briefing_req(alexa_client, "weather", password="wrongpass")
+    assert req.status == HTTPStatus.UNAUTHORIZED
+
+    assert caplog.text.count("Wrong password for Alexa flash briefing") == 2
+    assert "(2 more rejected requests since the last report)" in caplog.text
+
+
+async def test_flash_briefing_password_too_long(alexa_client) -> None:
+    """Test an overly long Flash Briefing password is rejected."""
+    password = "a" * (const.MAX_PASSWORD_LENGTH + 1)
+    req = await _flash_briefing_req(alexa_client, "weather", password=password)
+    assert req.status == HTTPStatus.UNAUTHORIZED
+    text = await req.text()
+    assert text == ""
+
+
 async def test_flash_briefing_request_for_password(alexa_client) -> None:
     """Test for "password" Flash Briefing."""
     req = await _flash_briefing_req(alexa_client, "password")
@@ -124,6 +187,21 @@ async def test_flash_briefing_date_from_str(alexa_client) -> None:
     )
 
 
+async def test_flash_briefing_generated_uid_is_stable(alexa_client) -> None:
+    """Test generated uids do not change between requests."""
+    req = await _flash_briefing_req(alexa_client, "weather")
+    assert req.status == HTTPStatus.OK
+    first = await req.json()
+
+    req = await _flash_briefing_req(alexa_client, "weather")
+    assert req.status == HTTPStatus.OK
+    second = await req.json()
+
+    uids = [item[const.ATTR_UID] for item in first]
+    assert len(set(uids)) == 2
+    assert uids == [item[const.ATTR_UID] for item in second]
+
+
 async def test_flash_briefing_valid(alexa_client) -> None:
     """Test the response is valid."""
     data = [
@@ -149,3 +227,39 @@ async def test_flash_briefing_valid(alexa_client) -> None:
     json[0].pop(const.ATTR_UPDATE_DATE)
     data[0].pop(const.ATTR_UPDATE_DATE)
     assert json == data
+
+
+async def test_flash_briefing_templated(alexa_client) -> None:
+    """Test templates in a Flash Briefing are rendered."""
+    req = await _flash_briefing_req(alexa_client, "templated")
+    assert req.status == HTTPStatus.OK
+    json = await req.json()
+    assert isinstance(
+        datetime.datetime.strptime(
+            json[0].pop(const.ATTR_UPDATE_DATE), const.DATE_FORMAT
+        ),
+        datetime.datetime,
+    )
+    assert json == [
+        {
+            "titleText": "Templated title",
+            "mainText": "",
+            "uid": "templated_uuid",
+        }
+    ]
+
+
+async def test_flash_briefing_configured_password_too_long(hass: HomeAssistant) -> None:
+    """Test a configured password over the length limit is rejected."""
+    assert not await async_setup_component(
+        hass,
+        alexa.DOMAIN,
+        {
+            "alexa": {
+                "flash_briefings": {
+                    "password": "a" * (const.MAX_PASSWORD_LENGTH + 1),
+                    "weather": [{"title": "Weekly forecast"}],
+                }
+            }
+        },
+    )